@@ -8,7 +8,7 @@ that grows as it eats food while avoiding collisions with walls and itself.
 import pygame
 import sys
 import random
-import time
+from collections import deque
 
 # Initialize pygame
 pygame.init()
@@ -42,6 +42,29 @@ UP = (0, -1)
 DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
+OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# Gameplay key bindings
+KEY_TO_DIR = {
+    pygame.K_UP: UP, pygame.K_w: UP,
+    pygame.K_DOWN: DOWN, pygame.K_s: DOWN,
+    pygame.K_LEFT: LEFT, pygame.K_a: LEFT,
+    pygame.K_RIGHT: RIGHT, pygame.K_d: RIGHT,
+}
+
+# Event types processed by Game.handle_events; WINDOWEXPOSED means the window needs repainting
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED)
+
+# Longest time (ms) a static screen sleeps waiting for input
+MENU_WAIT_TIMEOUT = 100
+
+
+def _cell_surface(color):
+    """Build a grid-cell sized surface filled with color and a black border."""
+    surf = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()  # Match display format for fast blits
+    surf.fill(color)
+    pygame.draw.rect(surf, BLACK, surf.get_rect(), 1)
+    return surf
 
 
 class Options:
@@ -51,7 +74,9 @@ class Options:
     def __init__(self):
         # Difficulty affects starting snake speed
         self.difficulties = ["Easy", "Medium", "Hard", "Very Hard", "Extreme"]
+        self.difficulty_fps = (10, 15, 30, 60, 120)  # Game speed for each difficulty
         self.difficulty_idx = 1  # Default to Medium
+        self.busy_loop_idx = 3  # From Very Hard up, tick() is too coarse for the frame time
         
         # Snake colors
         self.snake_colors = [GREEN, BLUE, YELLOW, PURPLE, CYAN, ORANGE]
@@ -69,6 +94,14 @@ class Options:
     def difficulty(self):
         return self.difficulties[self.difficulty_idx]
     
+    @property
+    def fps(self):
+        return self.difficulty_fps[self.difficulty_idx]
+    
+    @property
+    def precise_timing(self):
+        return self.difficulty_idx >= self.busy_loop_idx
+    
     @property
     def snake_color(self):
         return self.snake_colors[self.snake_color_idx]
@@ -112,51 +145,69 @@ class Snake:
     """
     def __init__(self, color=GREEN):
         """Initialize the snake with a default position and direction."""
-        self.positions = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]  # Start at the center
+        self.positions = deque([(GRID_WIDTH // 2, GRID_HEIGHT // 2)])  # Start at the center
+        self._occupied = set(self.positions)  # O(1) lookup of occupied cells
+        self.head = self.positions[0]
         self.direction = RIGHT
         self.next_direction = RIGHT
         self.grew = False
+        self.last_tail = None  # Cell vacated by the last move, if any
         self.color = color
+        # Pre-rendered segment tiles; the head uses a slightly different color
+        self._head_surf = _cell_surface(BLUE)
+        self._body_surf = _cell_surface(color)
 
     def get_head_position(self):
         """Return the position of the snake's head."""
-        return self.positions[0]
+        return self.head
 
     def change_direction(self, direction):
         """
         Change the snake's direction ensuring it can't reverse directly into itself.
         """
-        if self.next_direction != self._get_opposite_direction(direction):
+        if direction != OPPOSITE[self.next_direction]:
             self.next_direction = direction
 
-    def _get_opposite_direction(self, direction):
-        """Returns the opposite direction."""
-        if direction == UP:
-            return DOWN
-        elif direction == DOWN:
-            return UP
-        elif direction == LEFT:
-            return RIGHT
-        elif direction == RIGHT:
-            return LEFT
-
     def move(self):
         """Move the snake by updating its position."""
-        self.direction = self.next_direction
-        head = self.get_head_position()
-        x, y = self.direction
-        new_position = (((head[0] + x) % GRID_WIDTH), ((head[1] + y) % GRID_HEIGHT))
+        # Bind hot attributes and globals to locals
+        positions = self.positions
+        occupied = self._occupied
+        grew = self.grew
+        grid_width = GRID_WIDTH
+        grid_height = GRID_HEIGHT
         
-        # Check for collision with self
-        if new_position in self.positions[1:]:
+        self.direction = x, y = self.next_direction
+        head = self.head
+        
+        # Wrap around the edges; a step is at most one cell so no modulo is needed
+        new_x = head[0] + x
+        if new_x == grid_width:
+            new_x = 0
+        elif new_x < 0:
+            new_x = grid_width - 1
+        new_y = head[1] + y
+        if new_y == grid_height:
+            new_y = 0
+        elif new_y < 0:
+            new_y = grid_height - 1
+        new_position = (new_x, new_y)
+        
+        # Check for collision with self (the tail moves away unless growing)
+        if new_position in occupied and (grew or new_position != positions[-1]):
             return False  # Game over
         
         # Update positions
-        self.positions.insert(0, new_position)
-        if not self.grew:
-            self.positions.pop()
+        if not grew:
+            tail = positions.pop()
+            occupied.discard(tail)
+            self.last_tail = tail
         else:
+            self.last_tail = None
             self.grew = False
+        positions.appendleft(new_position)
+        occupied.add(new_position)
+        self.head = new_position
         return True
 
     def grow(self):
@@ -165,11 +216,27 @@ class Snake:
 
     def draw(self, surface):
         """Draw the snake on the game surface."""
-        for i, p in enumerate(self.positions):
-            r = pygame.Rect((p[0] * GRID_SIZE, p[1] * GRID_SIZE), (GRID_SIZE, GRID_SIZE))
-            # Use a slightly different color for the head
-            pygame.draw.rect(surface, BLUE if i == 0 else self.color, r)
-            pygame.draw.rect(surface, BLACK, r, 1)  # Draw a black border
+        body = self._body_surf
+        gs = GRID_SIZE
+        blits = [(body, (p[0] * gs, p[1] * gs)) for p in self.positions]
+        blits[0] = (self._head_surf, blits[0][1])
+        surface.blits(blits, doreturn=False)
+
+    def draw_moved(self, surface):
+        """Redraw only the cells changed by the last move and return their rects."""
+        positions = self.positions
+        gs = GRID_SIZE
+        dirty = []
+        tail = self.last_tail
+        if tail is not None:
+            dirty.append(surface.fill(BLACK, (tail[0] * gs, tail[1] * gs, gs, gs)))
+        if len(positions) > 1:
+            # The previous head becomes a body segment
+            neck = positions[1]
+            dirty.append(surface.blit(self._body_surf, (neck[0] * gs, neck[1] * gs)))
+        head = self.head
+        dirty.append(surface.blit(self._head_surf, (head[0] * gs, head[1] * gs)))
+        return dirty
 
 
 class Food:
@@ -180,17 +247,23 @@ class Food:
         """Initialize food with a random position."""
         self.position = (0, 0)
         self.color = color
+        self._surf = _cell_surface(color)
         self.randomize_position()
 
-    def randomize_position(self):
-        """Place food at a random position on the grid."""
-        self.position = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
+    def randomize_position(self, free_cells=None):
+        """
+        Place food at a random position on the grid, picked from free_cells if given.
+        
+        An empty free_cells means the board is full, so the position is left unchanged.
+        """
+        if free_cells is None:
+            self.position = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
+        elif free_cells:
+            self.position = random.choice(tuple(free_cells))
 
     def draw(self, surface):
-        """Draw the food on the game surface."""
-        r = pygame.Rect((self.position[0] * GRID_SIZE, self.position[1] * GRID_SIZE), (GRID_SIZE, GRID_SIZE))
-        pygame.draw.rect(surface, self.color, r)
-        pygame.draw.rect(surface, BLACK, r, 1)  # Draw a black border
+        """Draw the food on the game surface and return the affected rect."""
+        return surface.blit(self._surf, (self.position[0] * GRID_SIZE, self.position[1] * GRID_SIZE))
 
 
 class Game:
@@ -201,6 +274,9 @@ class Game:
         """Initialize the game with a window, snake, food, and score."""
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption('Snake Game')
+        # Only queue the events we actually handle
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont('Arial', 24)
         self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
@@ -209,8 +285,39 @@ class Game:
         self.selected_option = 0  # For menu navigation
         self.menu_options = ["Play Game", "Options", "Quit"]
         self.options_menu_items = ["Difficulty", "Snake Color", "Food Color", "Back"]
+        self._drawn_state = None  # State shown by the last draw
+        self._needs_redraw = True  # Static screens are only redrawn after input
+        self._all_cells = frozenset((x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT))
+        self._drawn_food_position = None
+        self._prerender_text()
         self.reset_game()
 
+    def _render_text(self, font, text, color):
+        """Render text to a surface converted to the display's pixel format."""
+        return font.render(text, True, color).convert_alpha()
+
+    def _prerender_text(self):
+        """Render static text once so the draw methods only need to blit it."""
+        render, font, title_font = self._render_text, self.font, self.title_font
+        self._menu_title_surf = render(title_font, "Snake Game", GREEN)
+        self._menu_surfs = [(render(font, o, WHITE), render(font, o, YELLOW))
+                            for o in self.menu_options]
+        self._menu_instructions_surf = render(font, "Use Arrow Keys to Navigate, Enter to Select", WHITE)
+        self._options_title_surf = render(title_font, "Options", GREEN)
+        self._options_surfs = [(render(font, o, WHITE), render(font, o, YELLOW))
+                               for o in self.options_menu_items]
+        self._difficulty_surfs = [(render(font, d, WHITE), render(font, d, YELLOW))
+                                  for d in self.options.difficulties]
+        self._options_instructions_surf = render(font, "Use Arrow Keys to Navigate and Change Values", WHITE)
+        self._game_over_surf = render(title_font, 'Game Over', RED)
+        self._restart_surf = render(font, 'Press R to Restart or M for Menu', WHITE)
+        # Score text only changes when the snake eats, so it is re-rendered lazily
+        self._score_surf = None
+        self._score_rect = None
+        self._score_cached = -1
+        self._final_score_surf = None
+        self._final_score_cached = -1
+
     def reset_game(self):
         """Reset the game state to start a new game."""
         self.snake = Snake(self.options.snake_color)
@@ -219,23 +326,32 @@ class Game:
 
     def handle_events(self):
         """Process user input events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if self.game_state == MENU:
-                    self.handle_menu_input(event.key)
-                elif self.game_state == OPTIONS:
-                    self.handle_options_input(event.key)
-                elif self.game_state == PLAYING:
-                    self.handle_game_input(event.key)
-                elif self.game_state == GAME_OVER:
-                    if event.key == pygame.K_r:
-                        self.reset_game()
-                        self.game_state = PLAYING
-                    elif event.key == pygame.K_m:
-                        self.game_state = MENU
+        for event in pygame.event.get(HANDLED_EVENTS):
+            self.handle_event(event)
+
+    def handle_event(self, event):
+        """Process a single user input event."""
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        elif event.type == pygame.WINDOWEXPOSED:
+            # The window contents may have been lost, so repaint all of it
+            self._needs_redraw = True
+            self._drawn_state = None
+        elif event.type == pygame.KEYDOWN:
+            self._needs_redraw = True
+            if self.game_state == MENU:
+                self.handle_menu_input(event.key)
+            elif self.game_state == OPTIONS:
+                self.handle_options_input(event.key)
+            elif self.game_state == PLAYING:
+                self.handle_game_input(event.key)
+            elif self.game_state == GAME_OVER:
+                if event.key == pygame.K_r:
+                    self.reset_game()
+                    self.game_state = PLAYING
+                elif event.key == pygame.K_m:
+                    self.game_state = MENU
 
     def handle_menu_input(self, key):
         """Handle input in the main menu."""
@@ -281,54 +397,52 @@ class Game:
 
     def handle_game_input(self, key):
         """Handle input during gameplay."""
-        if key == pygame.K_UP or key == pygame.K_w:
-            self.snake.change_direction(UP)
-        elif key == pygame.K_DOWN or key == pygame.K_s:
-            self.snake.change_direction(DOWN)
-        elif key == pygame.K_LEFT or key == pygame.K_a:
-            self.snake.change_direction(LEFT)
-        elif key == pygame.K_RIGHT or key == pygame.K_d:
-            self.snake.change_direction(RIGHT)
+        direction = KEY_TO_DIR.get(key)
+        if direction:
+            self.snake.change_direction(direction)
         elif key == pygame.K_ESCAPE:
             self.game_state = MENU
 
     def update(self):
         """Update game state."""
         if self.game_state == PLAYING:
+            self._needs_redraw = True
+            
             # Move snake and check for self collision
             if not self.snake.move():
                 self.game_state = GAME_OVER
                 return
 
             # Check for food collision
-            if self.snake.get_head_position() == self.food.position:
+            if self.snake.head == self.food.position:
                 self.snake.grow()
                 self.score += 1
                 
                 # Ensure food doesn't spawn on snake
-                while True:
-                    self.food.randomize_position()
-                    if self.food.position not in self.snake.positions:
-                        break
+                free_cells = self._all_cells - self.snake._occupied
+                if not free_cells:
+                    # The snake fills the whole board, so there is nowhere left to go
+                    self.game_state = GAME_OVER
+                    return
+                self.food.randomize_position(free_cells)
 
     def draw_menu(self):
         """Draw the main menu."""
         self.screen.fill(BLACK)
         
         # Draw title
-        title = self.title_font.render("Snake Game", True, GREEN)
+        title = self._menu_title_surf
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4))
         self.screen.blit(title, title_rect)
         
         # Draw menu options
-        for i, option in enumerate(self.menu_options):
-            color = YELLOW if i == self.selected_option else WHITE
-            text = self.font.render(option, True, color)
+        for i, surfs in enumerate(self._menu_surfs):
+            text = surfs[1 if i == self.selected_option else 0]
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + i * 50))
             self.screen.blit(text, text_rect)
         
         # Draw instructions
-        instructions = self.font.render("Use Arrow Keys to Navigate, Enter to Select", True, WHITE)
+        instructions = self._menu_instructions_surf
         instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
         self.screen.blit(instructions, instructions_rect)
 
@@ -337,25 +451,19 @@ class Game:
         self.screen.fill(BLACK)
         
         # Draw title
-        title = self.title_font.render("Options", True, GREEN)
+        title = self._options_title_surf
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//6))
         self.screen.blit(title, title_rect)
         
         # Draw option items
         y_offset = SCREEN_HEIGHT // 3
-        option_values = [
-            self.options.difficulty,
-            "< Preview >",
-            "< Preview >",
-            ""
-        ]
         
-        for i, option in enumerate(self.options_menu_items):
+        for i, surfs in enumerate(self._options_surfs):
             # Highlight selected option
-            color = YELLOW if i == self.selected_option else WHITE
+            selected = 1 if i == self.selected_option else 0
             
             # Draw option name
-            text = self.font.render(option, True, color)
+            text = surfs[selected]
             text_rect = text.get_rect(midright=(SCREEN_WIDTH//2 - 20, y_offset + i * 60))
             self.screen.blit(text, text_rect)
             
@@ -370,81 +478,107 @@ class Game:
                                 pygame.Rect(SCREEN_WIDTH//2 + 20, y_offset + i * 60 - 15, 30, 30))
                 pygame.draw.rect(self.screen, BLACK, 
                                 pygame.Rect(SCREEN_WIDTH//2 + 20, y_offset + i * 60 - 15, 30, 30), 1)
-            else:
-                value_text = self.font.render(option_values[i], True, color)
+            elif i == 0:  # Difficulty
+                value_text = self._difficulty_surfs[self.options.difficulty_idx][selected]
                 value_rect = value_text.get_rect(midleft=(SCREEN_WIDTH//2 + 20, y_offset + i * 60))
                 self.screen.blit(value_text, value_rect)
         
         # Draw instructions
-        instructions = self.font.render("Use Arrow Keys to Navigate and Change Values", True, WHITE)
+        instructions = self._options_instructions_surf
         instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
         self.screen.blit(instructions, instructions_rect)
 
     def draw_game(self):
-        """Draw the game elements."""
+        """
+        Draw the game elements.
+        
+        Returns the list of changed screen rects, or None if the whole screen was redrawn.
+        """
+        if self._drawn_state == PLAYING:
+            # Only the cells touched by the last move and food respawn have changed
+            dirty = self.snake.draw_moved(self.screen)
+            if self.food.position != self._drawn_food_position:
+                dirty.append(self.food.draw(self.screen))
+                self._drawn_food_position = self.food.position
+            # The score sits on top of the board, so fall back to a full redraw when it is touched
+            if self.score == self._score_cached and self._score_rect.collidelist(dirty) == -1:
+                return dirty
+        
         self.screen.fill(BLACK)
         
         # Draw snake and food
         self.snake.draw(self.screen)
         self.food.draw(self.screen)
+        self._drawn_food_position = self.food.position
         
         # Draw score
-        score_text = self.font.render(f'Score: {self.score}', True, WHITE)
-        self.screen.blit(score_text, (5, 5))
+        if self.score != self._score_cached:
+            self._score_surf = self._render_text(self.font, f'Score: {self.score}', WHITE)
+            self._score_rect = self._score_surf.get_rect(topleft=(5, 5))
+            self._score_cached = self.score
+        self.screen.blit(self._score_surf, self._score_rect)
+        return None
 
     def draw_game_over(self):
         """Draw the game over screen."""
         self.screen.fill(BLACK)
         
         # Draw game over message
-        game_over_text = self.title_font.render('Game Over', True, RED)
+        game_over_text = self._game_over_surf
         text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//3))
         self.screen.blit(game_over_text, text_rect)
         
         # Draw score
-        score_text = self.font.render(f'Final Score: {self.score}', True, WHITE)
+        if self.score != self._final_score_cached:
+            self._final_score_surf = self._render_text(self.font, f'Final Score: {self.score}', WHITE)
+            self._final_score_cached = self.score
+        score_text = self._final_score_surf
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         self.screen.blit(score_text, score_rect)
         
         # Draw restart instructions
-        restart_text = self.font.render('Press R to Restart or M for Menu', True, WHITE)
+        restart_text = self._restart_surf
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
         self.screen.blit(restart_text, restart_rect)
 
     def draw(self):
         """Render the game elements based on current state."""
+        dirty = None
         if self.game_state == MENU:
             self.draw_menu()
         elif self.game_state == OPTIONS:
             self.draw_options_menu()
         elif self.game_state == PLAYING:
-            self.draw_game()
+            dirty = self.draw_game()
         elif self.game_state == GAME_OVER:
             self.draw_game_over()
+        self._drawn_state = self.game_state
         
-        pygame.display.update()
+        if dirty is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(dirty)
 
     def run(self):
         """Main game loop."""
         while True:
             self.handle_events()
             self.update()
-            self.draw()
+            if self._needs_redraw:
+                self.draw()
+                self._needs_redraw = False
             
-            # Use the selected speed when playing, otherwise use a standard fps
+            # Use the selected speed when playing, otherwise sleep until input arrives
             if self.game_state == PLAYING:
-                if self.options.difficulty == "Easy":
-                    self.clock.tick(10)
-                elif self.options.difficulty == "Medium":
-                    self.clock.tick(15)
-                elif self.options.difficulty == "Hard":
-                    self.clock.tick(30)
-                elif self.options.difficulty == "Very Hard":
-                    self.clock.tick(60)
-                elif self.options.difficulty == "Extreme":
-                    self.clock.tick(120)
+                if self.options.precise_timing:
+                    # SDL_Delay is only ~10 ms accurate, so spin for high frame rates
+                    self.clock.tick_busy_loop(self.options.fps)
+                else:
+                    self.clock.tick(self.options.fps)
             else:
-                self.clock.tick(30)  # Standard FPS for menus
+                event = pygame.event.wait(MENU_WAIT_TIMEOUT)
+                if event.type != pygame.NOEVENT:
+                    self.handle_event(event)
 
 
 if __name__ == "__main__":